@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Sequence
 
 if TYPE_CHECKING:
-    from .converter import ConverterSettings
+    from .models import ConverterSettings
 
 __all__ = ["main", "run_conversion"]
 
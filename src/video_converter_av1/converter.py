@@ -2,16 +2,63 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Sequence
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator
-from tqdm import tqdm
+from typing import TYPE_CHECKING, Iterator, Sequence, TextIO
+
+from .uring import batch_file_sizes
+
+if TYPE_CHECKING:
+    from _csv import Writer as CsvWriter
+
+    from .models import ConverterSettings, EncoderCapabilities
+
+NVENC_MAX_SESSIONS = 2
+SOFTWARE_THREADS_PER_JOB = 4
+NVENC_THREADS = 2
+UNIQUE_PATH_SCAN_LIMIT = 10_000
+# 出力サイズの見積もりに使う入力サイズに対する倍率 (AV1 出力の上限として余裕を持たせる)。
+OUTPUT_SIZE_RATIO = 1.5
+EXISTING_SKIP_MESSAGE = "既存の出力をスキップしました"
+AV1_SKIP_MESSAGE = "既に AV1 形式のためスキップしました"
+CANCELLED_MESSAGE = "処理が中断されたため変換しませんでした"
+RESOLUTION_DIR_PATTERN = re.compile(r"\d+x\d+")
+LOG_HEADER = ("input", "output", "status", "message")
+# csv.writer (excel 方言) の既定値に合わせ、引用符付けが必要な文字と行末を定義する。
+CSV_SPECIAL_CHARS = re.compile(r'[,"\r\n]')
+CSV_LINE_TERMINATOR = "\r\n"
+# ffmpeg の標準エラー出力は 4KB 単位で読み取り、直近 16 チャンク (64KB) のみ保持する。
+STDERR_CHUNK_SIZE = 4096
+STDERR_TAIL_CHUNKS = 16
+
+# ffmpeg コマンドのテンプレート。"{...}" の要素は build_ffmpeg_command が実際の値へ置き換える。
+_COMMAND_PREFIX = ("ffmpeg", "-y", "-hide_banner", "-loglevel", "error", "-i", "{input}")
+_NVENC_TEMPLATE = (
+    *_COMMAND_PREFIX,
+    *("-c:v", "av1_nvenc", "-threads", "{threads}"),
+    *("-cq", "{quality}", "-b:v", "0", "-preset", "p5"),
+    *("-c:a", "copy", "{output}"),
+)
+_SOFTWARE_TEMPLATE = (
+    *_COMMAND_PREFIX,
+    *("-c:v", "{encoder}", "-threads", "{threads}"),
+    *("-crf", "{quality}", "-b:v", "0", "-cpu-used", "4"),
+    *("-c:a", "copy", "{output}"),
+)
+
+# 実行中に作成済みの出力ディレクトリ。同一フォルダへの mkdir の重複発行を避ける。
+_CREATED_DIRECTORIES: set[Path] = set()
 
 
 class ConversionStatus(str, Enum):
@@ -22,38 +69,18 @@ class ConversionStatus(str, Enum):
     SKIPPED = "skipped"
 
 
-class ConverterSettings(BaseModel):
-    """変換処理で使用する設定値。"""
-
-    input_dir: Path = Field(alias="input")
-    output_dir: Path = Field(alias="output")
-    quality: int = 28
-    skip_existing: bool = True
-    delete_original: bool = False
-    allow_software: bool = False
-
-    model_config = ConfigDict(populate_by_name=True)
-
-    @field_validator("quality")
-    @classmethod
-    def validate_quality(cls, value: int) -> int:
-        """画質パラメータの許容範囲を検証する。"""
-
-        if not 0 <= value <= 51:
-            raise ValueError("quality は 0-51 の範囲で指定してください")
-        return value
+@dataclass(slots=True)
+class ConversionSummary:
+    """最終サマリー表示用の統計情報。
 
-
-class ConversionSummary(BaseModel):
-    """最終サマリー表示用の統計情報。"""
+    ファイルごとに更新されるため、検証処理を伴わない dataclass で保持する。
+    """
 
     total: int = 0
     success: int = 0
     failed: int = 0
     skipped: int = 0
 
-    model_config = ConfigDict(validate_assignment=True)
-
     def register(self, status: ConversionStatus) -> None:
         """ファイル単位の結果をサマリーへ反映する。"""
 
@@ -66,7 +93,8 @@ class ConversionSummary(BaseModel):
             self.skipped += 1
 
 
-class ConversionLogEntry(BaseModel):
+@dataclass(slots=True)
+class ConversionLogEntry:
     """CSV に書き出す単一ファイルの処理結果。"""
 
     input_path: Path
@@ -75,12 +103,34 @@ class ConversionLogEntry(BaseModel):
     message: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class VideoStreamInfo:
+    """ffprobe で取得した映像ストリームの情報。"""
+
+    codec_name: str
+    width: int
+    height: int
+
+    @property
+    def resolution(self) -> tuple[int, int]:
+        """幅と高さの組を返す。"""
+
+        return self.width, self.height
+
+
 class ConversionSkip(RuntimeError):
     """ユーザー設定により処理をスキップする際に発生させる例外。"""
 
 
-def parse_arguments(args: Sequence[str] | None = None) -> ConverterSettings:
-    """コマンドライン引数を解析して設定モデルへ変換する。"""
+# ログ出力時に Enum の value プロパティを経由しないよう、文字列表現を事前に用意する。
+_STATUS_VALUES: dict[ConversionStatus, str] = {status: status.value for status in ConversionStatus}
+
+
+_PARSER: argparse.ArgumentParser | None = None
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """コマンドライン引数のパーサーを構築する。"""
 
     parser = argparse.ArgumentParser(description="Convert MP4 files to AV1 format")
     parser.add_argument("input", help="変換対象の動画が含まれる入力ディレクトリ")
@@ -106,7 +156,40 @@ def parse_arguments(args: Sequence[str] | None = None) -> ConverterSettings:
         action="store_true",
         help="NVENC が利用不可の場合にソフトウェアエンコードへ切り替え",
     )
-    namespace = parser.parse_args(args)
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help=(
+            "同時に実行する変換ジョブ数 "
+            "(デフォルト: NVENC は 2、ソフトウェアは CPU コア数から算出)"
+        ),
+    )
+    parser.add_argument(
+        "--skip-av1",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="既に AV1 で符号化されている動画を変換せずにスキップ (デフォルト: 有効)",
+    )
+    return parser
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """構築済みのパーサーを返す。初回呼び出し時のみ構築する。"""
+
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def parse_arguments(args: Sequence[str] | None = None) -> ConverterSettings:
+    """コマンドライン引数を解析して設定モデルへ変換する。"""
+
+    namespace = _get_parser().parse_args(args)
+    # --help などで終了する場合に Pydantic を読み込まないよう、解析後に import する。
+    from .models import ConverterSettings
+
     return ConverterSettings(
         input=Path(namespace.input).expanduser().resolve(),
         output=Path(namespace.output).expanduser().resolve(),
@@ -114,6 +197,8 @@ def parse_arguments(args: Sequence[str] | None = None) -> ConverterSettings:
         skip_existing=not namespace.no_skip_existing,
         delete_original=namespace.delete_original,
         allow_software=namespace.allow_software,
+        jobs=namespace.jobs,
+        skip_av1=namespace.skip_av1,
     )
 
 
@@ -122,9 +207,29 @@ def collect_target_files(input_dir: Path) -> list[Path]:
 
     if not input_dir.exists():
         raise FileNotFoundError(f"入力ディレクトリが存在しません: {input_dir}")
-    files = [path for path in input_dir.rglob("*.mp4") if path.is_file()]
-    files.sort()
-    return files
+    return sorted(_iter_mp4(input_dir))
+
+
+def _iter_mp4(root: Path) -> Iterator[Path]:
+    """os.scandir でディレクトリを走査し、MP4 ファイルのパスを列挙する。
+
+    ディレクトリエントリが保持する種別情報を使うため、通常ファイルに対して
+    追加の stat を発行しない。シンボリックリンクのディレクトリは辿らない。
+    Path.rglob と同様に、読み取り権限の無いディレクトリは黙って読み飛ばす。
+    """
+
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            scanner = os.scandir(stack.pop())
+        except PermissionError:
+            continue
+        with scanner as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".mp4") and entry.is_file():
+                    yield Path(entry.path)
 
 
 def ensure_output_directory(output_dir: Path) -> None:
@@ -152,31 +257,168 @@ def select_encoder(allow_software: bool) -> str:
     raise RuntimeError(msg)
 
 
-def is_nvenc_available() -> bool:
-    """ffmpeg のエンコーダー一覧を参照し NVENC の利用可否を判定する。"""
+def resolve_jobs(encoder: str, jobs: int | None) -> int:
+    """エンコーダーに応じた並列ジョブ数を決定する。"""
+
+    if jobs is not None:
+        return jobs
+    if encoder == "av1_nvenc":
+        return NVENC_MAX_SESSIONS
+    return max(1, (os.cpu_count() or 1) // SOFTWARE_THREADS_PER_JOB)
+
+
+def resolve_threads(encoder: str, jobs: int) -> int:
+    """ジョブあたりに割り当てる ffmpeg のスレッド数を決定する。"""
+
+    if encoder == "av1_nvenc":
+        # エンコードは GPU が担うため、CPU 側はデコードと多重化に必要な分だけでよい。
+        return NVENC_THREADS
+    return max(1, (os.cpu_count() or 1) // jobs)
+
+
+@functools.lru_cache(maxsize=1)
+def find_ffmpeg() -> str:
+    """PATH 上の ffmpeg 実行ファイルの絶対パスを返す。"""
+
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:  # pragma: no cover - 実行環境依存
+        raise FileNotFoundError("ffmpeg コマンドが見つかりません")
+    return ffmpeg_path
+
+
+def _caps_cache_path() -> Path:
+    """エンコーダー検出結果のキャッシュファイルのパスを返す。"""
+
+    cache_root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_root) / "video_converter_av1" / "caps.json"
+
+
+def _load_caps_cache() -> EncoderCapabilities | None:
+    """キャッシュ済みのエンコーダー検出結果を読み込む。"""
+
+    from pydantic import ValidationError
+
+    from .models import EncoderCapabilities
 
+    try:
+        content = _caps_cache_path().read_text(encoding="utf-8")
+        return EncoderCapabilities.model_validate_json(content)
+    except (OSError, ValidationError):
+        return None
+
+
+def _save_caps_cache(capabilities: EncoderCapabilities) -> None:
+    """エンコーダー検出結果をキャッシュファイルへ保存する。"""
+
+    cache_path = _caps_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(capabilities.model_dump_json(), encoding="utf-8")
+    except OSError:  # pragma: no cover - キャッシュ保存失敗は無視する
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def is_nvenc_available() -> bool:
+    """ffmpeg のエンコーダー一覧を参照し NVENC の利用可否を判定する。
+
+    判定結果は ffmpeg のパスと更新日時をキーとしてキャッシュし、
+    ffmpeg が差し替えられていない限り再実行時もプロセスを起動しない。
+    """
+
+    from .models import EncoderCapabilities
+
+    ffmpeg_path = find_ffmpeg()
+    ffmpeg_mtime = os.stat(ffmpeg_path).st_mtime
+    cached = _load_caps_cache()
+    if (
+        cached is not None
+        and cached.ffmpeg_path == ffmpeg_path
+        and cached.ffmpeg_mtime == ffmpeg_mtime
+    ):
+        return cached.has_av1_nvenc
     try:
         result = subprocess.run(
-            ["ffmpeg", "-hide_banner", "-encoders"],
+            [ffmpeg_path, "-hide_banner", "-encoders"],
             check=True,
             capture_output=True,
             text=True,
         )
     except FileNotFoundError as exc:  # pragma: no cover - 実行環境依存
         raise FileNotFoundError("ffmpeg コマンドが見つかりません") from exc
-    return "av1_nvenc" in result.stdout
+    has_av1_nvenc = "av1_nvenc" in result.stdout
+    _save_caps_cache(
+        EncoderCapabilities(
+            ffmpeg_path=ffmpeg_path,
+            ffmpeg_mtime=ffmpeg_mtime,
+            has_av1_nvenc=has_av1_nvenc,
+        )
+    )
+    return has_av1_nvenc
 
 
-def ensure_disk_capacity(target_dir: Path, required_bytes: int) -> None:
-    """出力先ドライブの空き容量が十分かどうかを検証する。"""
+def ensure_disk_capacity(target_dir: Path, required_bytes: int) -> int:
+    """出力先ドライブの空き容量が十分かどうかを検証し、空き容量を返す。"""
 
     usage = shutil.disk_usage(target_dir)
     if usage.free < required_bytes:
         raise RuntimeError("ディスクの空き容量が不足しています")
+    return usage.free
+
+
+class DiskSpaceBudget:
+    """出力先の空き容量を見積もりで管理し、空き容量の問い合わせ回数を抑える。
+
+    実行開始時に 1 度だけ空き容量を取得し、以降は出力サイズの見積もりを差し引く。
+    見積もり上の残量が不足した場合のみ、実際の空き容量を取得し直す。
+    再取得した空き容量には実行中のエンコードが書き込む分がまだ反映されていないため、
+    確保中の見積もり合計を差し引いて残量とする。
+    """
+
+    def __init__(self, target_dir: Path) -> None:
+        self._target_dir = target_dir
+        self._remaining = ensure_disk_capacity(target_dir, 0)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def reserve(self, required_bytes: int) -> int:
+        """入力サイズに応じた容量を確保し、確保した見積もりバイト数を返す。
+
+        容量が不足する場合は例外を送出する。
+        """
+
+        estimated = int(required_bytes * OUTPUT_SIZE_RATIO)
+        with self._lock:
+            if self._remaining < estimated:
+                free = ensure_disk_capacity(self._target_dir, required_bytes + self._in_flight)
+                self._remaining = free - self._in_flight
+            self._remaining -= estimated
+            self._in_flight += estimated
+        return estimated
+
+    def release(self, reserved_bytes: int) -> None:
+        """エンコード完了時に、確保していた見積もりを実行中の合計から外す。"""
+
+        with self._lock:
+            self._in_flight -= reserved_bytes
+
+
+@dataclass(frozen=True, slots=True)
+class ConversionContext:
+    """全ファイルで共有する変換時の実行パラメータ。"""
 
+    encoder: str
+    threads: int
+    budget: DiskSpaceBudget
+    encode_slots: threading.Semaphore
+    file_sizes: dict[Path, int]
+    input_prefix: str
+    output_root: str
+    cancelled: threading.Event
 
-def probe_video_resolution(file_path: Path) -> tuple[int, int]:
-    """ffprobe を利用して入力動画の解像度を取得する。"""
+
+def probe_video_stream(file_path: Path) -> VideoStreamInfo:
+    """ffprobe を利用して入力動画のコーデック名と解像度を 1 回の起動で取得する。"""
 
     command = [
         "ffprobe",
@@ -185,9 +427,9 @@ def probe_video_resolution(file_path: Path) -> tuple[int, int]:
         "-select_streams",
         "v:0",
         "-show_entries",
-        "stream=width,height",
+        "stream=codec_name,width,height",
         "-of",
-        "csv=s=x:p=0",
+        "csv=p=0",
         str(file_path),
     ]
     try:
@@ -199,105 +441,254 @@ def probe_video_resolution(file_path: Path) -> tuple[int, int]:
         )
     except FileNotFoundError as exc:  # pragma: no cover - 実行環境依存
         raise FileNotFoundError("ffprobe コマンドが見つかりません") from exc
-    resolution = result.stdout.strip()
+    fields = result.stdout.strip()
     try:
-        width_str, height_str = resolution.split("x")
+        codec_name, width_str, height_str = fields.split(",")
         width = int(width_str)
         height = int(height_str)
     except ValueError as exc:
         raise RuntimeError("動画の解像度を取得できませんでした") from exc
     if width <= 0 or height <= 0:
         raise RuntimeError("動画の解像度を取得できませんでした")
-    return width, height
+    return VideoStreamInfo(codec_name=codec_name, width=width, height=height)
 
 
 def build_output_path(
-    file_path: Path, settings: ConverterSettings, resolution: tuple[int, int]
+    file_path: Path,
+    settings: ConverterSettings,
+    resolution: tuple[int, int],
+    input_prefix: str,
+    output_root: str,
 ) -> Path:
-    """入力ファイルに対応する出力ファイルのパスを生成する。"""
+    """入力ファイルに対応する出力ファイルのパスを生成する。
 
-    relative = file_path.relative_to(settings.input_dir)
-    width, height = resolution
-    resolution_dir = settings.output_dir / f"{width}x{height}"
-    candidate = (resolution_dir / relative).with_suffix(".mp4")
-    candidate.parent.mkdir(parents=True, exist_ok=True)
+    ``input_prefix`` と ``output_root`` は実行開始時に 1 度だけ文字列化した
+    入出力ディレクトリで、ファイルごとの中間 Path オブジェクト生成を避ける。
+    """
+
+    relative_name = _relative_output_name(file_path, input_prefix)
+    candidate = _output_candidate(relative_name, output_root, resolution)
     if candidate.exists():
         if settings.skip_existing:
-            raise ConversionSkip("既存の出力をスキップしました")
+            raise ConversionSkip(EXISTING_SKIP_MESSAGE)
         return generate_unique_path(candidate)
+    ensure_parent_directory(candidate)
     return candidate
 
 
+def _input_prefix(input_dir: Path) -> str:
+    """相対パスの切り出しに使う、末尾に区切り文字を付けた入力ディレクトリ文字列を返す。
+
+    走査結果は Path で包む際に正規化され、``Path(".")`` 配下では先頭の ``./`` が
+    取り除かれる。同じ正規化を経た子パスから求めることで、接頭辞と食い違わないようにする。
+    """
+
+    return os.fspath(Path(input_dir, "_"))[:-1]
+
+
+def _relative_output_name(file_path: Path, input_prefix: str) -> str:
+    """入力ディレクトリからの相対パスを、拡張子を .mp4 にした文字列で返す。"""
+
+    base, _ = os.path.splitext(os.fspath(file_path)[len(input_prefix) :])
+    return base + ".mp4"
+
+
+def _output_candidate(relative_name: str, output_root: str, resolution: tuple[int, int]) -> Path:
+    """ディレクトリを作成せずに、出力ファイルの候補パスのみを算出する。"""
+
+    width, height = resolution
+    return Path(output_root, f"{width}x{height}", relative_name)
+
+
+def _list_resolution_dirs(output_dir: Path) -> list[str]:
+    """出力ディレクトリ直下にある解像度別ディレクトリ (``<幅>x<高さ>``) を列挙する。"""
+
+    with os.scandir(output_dir) as entries:
+        return [
+            entry.path
+            for entry in entries
+            if RESOLUTION_DIR_PATTERN.fullmatch(entry.name) and entry.is_dir()
+        ]
+
+
+def _has_existing_output(relative_name: str, resolution_dirs: list[str]) -> bool:
+    """いずれかの解像度別ディレクトリに変換済みの出力が存在するかを判定する。
+
+    ffprobe を起動せずに判定できるため、大半が変換済みの再実行を高速化できる。
+    """
+
+    return any(
+        os.path.exists(os.path.join(directory, relative_name)) for directory in resolution_dirs
+    )
+
+
+def _skipped_entry_for(file_path: Path) -> ConversionLogEntry:
+    """既存の出力によりスキップしたファイルのログエントリを生成する。"""
+
+    return ConversionLogEntry(
+        input_path=file_path,
+        output_path=None,
+        status=ConversionStatus.SKIPPED,
+        message=EXISTING_SKIP_MESSAGE,
+    )
+
+
+def ensure_parent_directory(path: Path) -> None:
+    """出力ファイルの親ディレクトリを、未作成の場合に限り作成する。"""
+
+    parent = path.parent
+    if parent in _CREATED_DIRECTORIES:
+        return
+    parent.mkdir(parents=True, exist_ok=True)
+    _CREATED_DIRECTORIES.add(parent)
+
+
 def generate_unique_path(base_path: Path) -> Path:
-    """重複ファイル名を避けるためのパスを生成する。"""
+    """重複ファイル名を避けるためのパスを生成する。
+
+    親ディレクトリを 1 度だけ走査し、``<stem>_<番号><suffix>`` の最大番号に 1 を加える。
+    エントリ数が多すぎる場合は走査を打ち切り、ランダムな接尾辞で衝突を回避する。
+    """
 
     stem = base_path.stem
     suffix = base_path.suffix
     parent = base_path.parent
-    counter = 1
-    new_path = base_path
-    while new_path.exists():
-        new_path = parent / f"{stem}_{counter}{suffix}"
-        counter += 1
-    return new_path
+    pattern = re.compile(rf"{re.escape(stem)}_(\d+){re.escape(suffix)}")
+    max_index = 0
+    with os.scandir(parent) as entries:
+        for count, entry in enumerate(entries):
+            if count >= UNIQUE_PATH_SCAN_LIMIT:
+                return parent / f"{stem}_{uuid.uuid4().hex[:8]}{suffix}"
+            matched = pattern.fullmatch(entry.name)
+            if matched:
+                max_index = max(max_index, int(matched.group(1)))
+    return parent / f"{stem}_{max_index + 1}{suffix}"
 
 
 def build_ffmpeg_command(
-    input_path: Path, output_path: Path, encoder: str, quality: int
+    input_path: Path, output_path: Path, encoder: str, quality: int, threads: int
 ) -> list[str]:
-    """ffmpeg 実行コマンドを組み立てる。"""
+    """ffmpeg 実行コマンドを組み立てる。
 
-    command = [
-        "ffmpeg",
-        "-y",
-        "-hide_banner",
-        "-loglevel",
-        "error",
-        "-stats",
-        "-i",
-        str(input_path),
-        "-c:v",
-        encoder,
-    ]
-    if encoder == "av1_nvenc":
-        command += ["-cq", str(quality), "-b:v", "0", "-preset", "p5"]
-    else:
-        command += ["-crf", str(quality), "-b:v", "0", "-cpu-used", "4"]
-    command += ["-c:a", "copy", str(output_path)]
-    return command
+    エンコーダーごとの固定テンプレートのうち、プレースホルダーの要素だけを置き換える。
+    """
+
+    template = _NVENC_TEMPLATE if encoder == "av1_nvenc" else _SOFTWARE_TEMPLATE
+    values = {
+        "{input}": str(input_path),
+        "{output}": str(output_path),
+        "{encoder}": encoder,
+        "{quality}": str(quality),
+        "{threads}": str(threads),
+    }
+    return [values.get(arg, arg) for arg in template]
+
+
+@dataclass(slots=True)
+class LogWriter:
+    """追記中のログファイルと、引用符付けが必要な行に使う CSV ライター。"""
+
+    handle: TextIO
+    writer: CsvWriter
+
+
+def open_log_writer(handle: TextIO) -> LogWriter:
+    """追記モードで開いたログファイルから書き込み用オブジェクトを生成する。
+
+    ファイルが空の場合のみヘッダー行を書き込む。
+    """
+
+    writer = csv.writer(handle)
+    if handle.tell() == 0:
+        writer.writerow(LOG_HEADER)
+    return LogWriter(handle=handle, writer=writer)
+
+
+def write_log_entry(log_writer: LogWriter, entry: ConversionLogEntry) -> None:
+    """開いているログファイルへエントリを 1 行書き込む。
+
+    引用符付けが不要な一般的な行は連結して直接書き込み、区切り文字や改行を含む
+    行のみ csv モジュールへ委ねる。
+    """
+
+    row = (
+        str(entry.input_path),
+        str(entry.output_path) if entry.output_path else "",
+        _STATUS_VALUES[entry.status],
+        entry.message or "",
+    )
+    if any(CSV_SPECIAL_CHARS.search(field) for field in row):
+        log_writer.writer.writerow(row)
+        return
+    log_writer.handle.write(",".join(row) + CSV_LINE_TERMINATOR)
+
+
+def run_ffmpeg(command: list[str]) -> None:
+    """ffmpeg を実行し、異常終了時は標準エラー出力の末尾を含む例外を送出する。
+
+    標準エラー出力は端末へ流さず、末尾の一定量のみをリングバッファに保持する。
+    """
+
+    tail: deque[bytes] = deque(maxlen=STDERR_TAIL_CHUNKS)
+    # 並列実行する ffmpeg が端末設定の変更やキー入力の読み取りで競合しないよう、
+    # 標準入力は端末から切り離す。
+    with subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    ) as process:
+        assert process.stderr is not None
+        for chunk in iter(functools.partial(process.stderr.read, STDERR_CHUNK_SIZE), b""):
+            tail.append(chunk)
+        returncode = process.wait()
+    if returncode != 0:
+        detail = b"".join(tail).decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"ffmpeg が異常終了しました (終了コード {returncode}): {detail}")
 
 
 def append_log_entry(log_path: Path, entry: ConversionLogEntry) -> None:
     """CSV ログファイルへエントリを追記する。"""
 
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    write_header = not log_path.exists()
     with log_path.open("a", newline="", encoding="utf-8") as handle:
-        writer = csv.writer(handle)
-        if write_header:
-            writer.writerow(["input", "output", "status", "message"])
-        writer.writerow(
-            [
-                str(entry.input_path),
-                str(entry.output_path) if entry.output_path else "",
-                entry.status.value,
-                entry.message or "",
-            ]
-        )
+        write_log_entry(open_log_writer(handle), entry)
 
 
 def convert_single_file(
     file_path: Path,
     settings: ConverterSettings,
-    encoder: str,
+    context: ConversionContext,
 ) -> ConversionLogEntry:
-    """単一ファイルの変換処理を実行する。"""
-
-    resolution = probe_video_resolution(file_path)
-    output_path = build_output_path(file_path, settings, resolution)
-    ensure_disk_capacity(output_path.parent, file_path.stat().st_size)
-    command = build_ffmpeg_command(file_path, output_path, encoder, settings.quality)
-    subprocess.run(command, check=True)
+    """単一ファイルの変換処理を実行する。
+
+    解像度の取得やコマンドの組み立ては ffmpeg の実行枠の外で行い、
+    先行ファイルのエンコード中に次のファイルの準備を済ませておく。
+    """
+
+    if context.cancelled.is_set():
+        raise ConversionSkip(CANCELLED_MESSAGE)
+    stream = probe_video_stream(file_path)
+    if settings.skip_av1 and stream.codec_name == "av1":
+        raise ConversionSkip(AV1_SKIP_MESSAGE)
+    output_path = build_output_path(
+        file_path, settings, stream.resolution, context.input_prefix, context.output_root
+    )
+    file_size = context.file_sizes.get(file_path)
+    if file_size is None:
+        file_size = file_path.stat().st_size
+    command = build_ffmpeg_command(
+        file_path, output_path, context.encoder, settings.quality, context.threads
+    )
+    reserved = context.budget.reserve(file_size)
+    try:
+        with context.encode_slots:
+            # 実行枠を待つ間に中断された場合は、ffmpeg を起動しない。
+            if context.cancelled.is_set():
+                raise ConversionSkip(CANCELLED_MESSAGE)
+            run_ffmpeg(command)
+    finally:
+        context.budget.release(reserved)
     if settings.delete_original:
         file_path.unlink(missing_ok=True)
     return ConversionLogEntry(
@@ -308,35 +699,100 @@ def convert_single_file(
     )
 
 
+def _process_one(
+    file_path: Path,
+    settings: ConverterSettings,
+    context: ConversionContext,
+) -> ConversionLogEntry:
+    """単一ファイルを変換し、例外を含めた結果をログエントリとして返す。"""
+
+    try:
+        return convert_single_file(file_path, settings, context)
+    except ConversionSkip as skip_error:
+        return ConversionLogEntry(
+            input_path=file_path,
+            output_path=None,
+            status=ConversionStatus.SKIPPED,
+            message=str(skip_error),
+        )
+    except Exception as error:  # ffmpeg の異常終了や想定外のエラーを失敗として記録する
+        return ConversionLogEntry(
+            input_path=file_path,
+            output_path=None,
+            status=ConversionStatus.FAILED,
+            message=str(error),
+        )
+
+
 def run_conversion(settings: ConverterSettings) -> int:
     """設定値に基づき一連の変換処理を実行する。"""
 
+    from tqdm import tqdm
+
     files = collect_target_files(settings.input_dir)
     ensure_output_directory(settings.output_dir)
+    _CREATED_DIRECTORIES.clear()
     encoder = select_encoder(settings.allow_software)
+    jobs = resolve_jobs(encoder, settings.jobs)
     log_path = settings.output_dir / "convert_log.csv"
     summary = ConversionSummary()
-    progress_bar = tqdm(files, unit="file", disable=not sys.stdout.isatty())
-    for file_path in progress_bar:
-        progress_bar.set_description(file_path.name)
+    interactive = sys.stdout.isatty()
+    progress_bar = tqdm(
+        total=len(files),
+        unit="file",
+        disable=not interactive,
+        mininterval=0.5,
+        miniters=max(1, len(files) // 200),
+    )
+    # ffmpeg は別プロセスで動作するため、スレッドで起動・待機するだけで並列化できる。
+    # 同時実行数は encode_slots で jobs に制限し、余分な 1 スレッドで次のファイルを準備する。
+    # ログはメインスレッドのみが書き込むため、ファイルを開いたまま逐次追記する。
+    with (
+        log_path.open("a", newline="", encoding="utf-8") as log_handle,
+        ThreadPoolExecutor(max_workers=jobs + 1) as executor,
+    ):
+        log_writer = open_log_writer(log_handle)
+        input_prefix = _input_prefix(settings.input_dir)
+        resolution_dirs = (
+            _list_resolution_dirs(settings.output_dir) if settings.skip_existing else []
+        )
+        pending = []
+        for file_path in files:
+            if resolution_dirs and _has_existing_output(
+                _relative_output_name(file_path, input_prefix), resolution_dirs
+            ):
+                entry = _skipped_entry_for(file_path)
+                progress_bar.update(1)
+                write_log_entry(log_writer, entry)
+                summary.register(entry.status)
+                continue
+            pending.append(file_path)
+        context = ConversionContext(
+            encoder=encoder,
+            threads=resolve_threads(encoder, jobs),
+            budget=DiskSpaceBudget(settings.output_dir),
+            encode_slots=threading.BoundedSemaphore(jobs),
+            file_sizes=batch_file_sizes(pending),
+            input_prefix=input_prefix,
+            output_root=os.fspath(settings.output_dir),
+            cancelled=threading.Event(),
+        )
         try:
-            entry = convert_single_file(file_path, settings, encoder)
-        except ConversionSkip as skip_error:
-            entry = ConversionLogEntry(
-                input_path=file_path,
-                output_path=None,
-                status=ConversionStatus.SKIPPED,
-                message=str(skip_error),
-            )
-        except Exception as error:  # pragma: no cover - 想定外エラー
-            entry = ConversionLogEntry(
-                input_path=file_path,
-                output_path=None,
-                status=ConversionStatus.FAILED,
-                message=str(error),
-            )
-        append_log_entry(log_path, entry)
-        summary.register(entry.status)
+            futures = [
+                executor.submit(_process_one, file_path, settings, context) for file_path in pending
+            ]
+            for future in as_completed(futures):
+                entry = future.result()
+                if interactive:
+                    progress_bar.set_description(entry.input_path.name, refresh=False)
+                progress_bar.update(1)
+                write_log_entry(log_writer, entry)
+                summary.register(entry.status)
+        except BaseException:
+            # Ctrl+C やログ書き込みの失敗時は、未着手のファイルを変換・削除しない。
+            context.cancelled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
     progress_bar.close()
     print_summary(summary, log_path)
     return 0 if summary.failed == 0 else 1
@@ -360,6 +816,16 @@ def main(argv: Sequence[str] | None = None) -> int:
     return run_conversion(settings)
 
 
+def __getattr__(name: str) -> object:
+    """Pydantic モデルを初回参照時に読み込み、従来の import 経路を維持する。"""
+
+    if name in {"ConverterSettings", "EncoderCapabilities"}:
+        from . import models
+
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "ConversionStatus",
     "ConverterSettings",
@@ -0,0 +1,52 @@
+"""利用者の入力やキャッシュファイルを検証する Pydantic モデル。
+
+Pydantic の読み込みには時間がかかるため、converter モジュールからは
+必要になった時点で遅延して読み込む。
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+class ConverterSettings(BaseModel):
+    """変換処理で使用する設定値。"""
+
+    input_dir: Path = Field(alias="input")
+    output_dir: Path = Field(alias="output")
+    quality: int = 28
+    skip_existing: bool = True
+    delete_original: bool = False
+    allow_software: bool = False
+    jobs: int | None = None
+    skip_av1: bool = True
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    @field_validator("quality")
+    @classmethod
+    def validate_quality(cls, value: int) -> int:
+        """画質パラメータの許容範囲を検証する。"""
+
+        if not 0 <= value <= 51:
+            raise ValueError("quality は 0-51 の範囲で指定してください")
+        return value
+
+    @field_validator("jobs")
+    @classmethod
+    def validate_jobs(cls, value: int | None) -> int | None:
+        """並列ジョブ数が 1 以上であることを検証する。"""
+
+        if value is not None and value < 1:
+            raise ValueError("jobs は 1 以上で指定してください")
+        return value
+
+
+class EncoderCapabilities(BaseModel):
+    """ffmpeg のエンコーダー検出結果をキャッシュへ保存するためのモデル。"""
+
+    ffmpeg_path: str
+    ffmpeg_mtime: float
+    has_av1_nvenc: bool
@@ -0,0 +1,72 @@
+"""io_uring を利用してファイルサイズをまとめて取得する補助モジュール。
+
+環境変数 ``VCAV1_USE_IO_URING=1`` が指定され、任意依存の ``liburing`` が
+利用できる場合に限り有効になる。それ以外の環境では何もせず、呼び出し側は
+従来どおりファイルごとに ``stat`` を発行する。
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import Sequence
+
+USE_IO_URING_ENV = "VCAV1_USE_IO_URING"
+MAX_BATCH_SIZE = 16384
+
+
+def batch_file_sizes(paths: Sequence[Path]) -> dict[Path, int]:
+    """STATX 要求をまとめて発行し、取得できたファイルのサイズを返す。
+
+    io_uring が無効・利用不可の場合や取得に失敗したパスは結果に含めない。
+    """
+
+    if not paths or os.environ.get(USE_IO_URING_ENV) != "1":
+        return {}
+    try:
+        import liburing  # type: ignore[import-untyped, import-not-found]
+    except ImportError:
+        return {}
+    sizes: dict[Path, int] = {}
+    try:
+        for start in range(0, len(paths), MAX_BATCH_SIZE):
+            sizes.update(_statx_sizes(liburing, paths[start : start + MAX_BATCH_SIZE]))
+    except OSError:  # pragma: no cover - カーネル設定やサンドボックスに依存
+        pass
+    return sizes
+
+
+def _statx_sizes(liburing: ModuleType, paths: Sequence[Path]) -> dict[Path, int]:
+    """1 つのリングで最大 MAX_BATCH_SIZE 件の STATX を実行する。"""
+
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    liburing.io_uring_queue_init(len(paths), ring)
+    try:
+        buffers = []
+        for index, path in enumerate(paths):
+            sqe = liburing.io_uring_get_sqe(ring)
+            buffer = liburing.Statx()
+            liburing.io_uring_prep_statx(sqe, buffer, os.fspath(path), mask=liburing.STATX_SIZE)
+            sqe.user_data = index
+            buffers.append(buffer)
+        liburing.io_uring_submit_and_wait(ring, len(paths))
+        sizes: dict[Path, int] = {}
+        for _ in paths:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            completed = cqe[0]
+            index = completed.user_data
+            try:
+                # liburing は失敗した要求の res を参照した時点で、errno に応じた
+                # OSError を送出する。負の値が返る実装にも備えて明示的に判定する。
+                res = completed.res
+            except OSError:
+                res = -1
+            finally:
+                liburing.io_uring_cqe_seen(ring, completed)
+            if res is not None and res >= 0:
+                sizes[paths[index]] = buffers[index].size
+        return sizes
+    finally:
+        liburing.io_uring_queue_exit(ring)
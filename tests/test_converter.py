@@ -1,30 +1,70 @@
 from __future__ import annotations
 
 import csv
+import io
+import os
+import subprocess
+import threading
+import time
 from pathlib import Path
 from types import SimpleNamespace
+from typing import Callable
 
 import pytest
 
+from video_converter_av1 import converter, uring
 from video_converter_av1.converter import ConverterSettings, run_conversion
 
 
-@pytest.fixture()
-def fake_ffmpeg(monkeypatch):
-    """ffmpeg/ffprobe 呼び出しを記録し、外部プロセスを起動しないスタブ。"""
+class FakePopen:
+    """ffmpeg プロセスの代わりに、指定した終了コードと標準エラー出力を返すスタブ。"""
+
+    def __init__(self, returncode: int = 0, stderr: bytes = b"") -> None:
+        self.returncode = returncode
+        self.stderr = io.BytesIO(stderr)
+
+    def __enter__(self) -> FakePopen:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def wait(self) -> int:
+        return self.returncode
+
+
+def install_fake_tools(
+    monkeypatch,
+    probe_stdout: str = "h264,1920,1080",
+    on_encode: Callable[[list[str]], FakePopen | None] | None = None,
+    probes: list[list[str]] | None = None,
+) -> list[list[str]]:
+    """ffprobe を subprocess.run、ffmpeg を subprocess.Popen のスタブへ差し替える。"""
 
     calls: list[list[str]] = []
 
-    def stub(command: list[str], *args, **kwargs) -> SimpleNamespace:
-        if command[0] == "ffprobe":
-            return SimpleNamespace(returncode=0, stdout="1920x1080")
+    def run_stub(command: list[str], *args, **kwargs) -> SimpleNamespace:
+        if probes is not None:
+            probes.append(command)
+        return SimpleNamespace(returncode=0, stdout=probe_stdout)
+
+    def popen_stub(command: list[str], *args, **kwargs) -> FakePopen:
         calls.append(command)
-        return SimpleNamespace(returncode=0, stdout="")
+        process = on_encode(command) if on_encode else None
+        return process or FakePopen()
 
-    monkeypatch.setattr("video_converter_av1.converter.subprocess.run", stub)
+    monkeypatch.setattr("video_converter_av1.converter.subprocess.run", run_stub)
+    monkeypatch.setattr("video_converter_av1.converter.subprocess.Popen", popen_stub)
     return calls
 
 
+@pytest.fixture()
+def fake_ffmpeg(monkeypatch):
+    """ffmpeg/ffprobe 呼び出しを記録し、外部プロセスを起動しないスタブ。"""
+
+    return install_fake_tools(monkeypatch)
+
+
 def create_sample_file(path: Path) -> None:
     """空の MP4 ファイルを生成する。"""
 
@@ -59,6 +99,8 @@ def test_run_conversion_successful_flow(tmp_path, monkeypatch, fake_ffmpeg):
     assert output_path.suffix == ".mp4"
     assert output_path.parent == output_dir / "1920x1080"
     assert fake_ffmpeg[0][-1].endswith(".mp4"), "ffmpeg 出力が MP4 になっていません"
+    threads_index = fake_ffmpeg[0].index("-threads")
+    assert int(fake_ffmpeg[0][threads_index + 1]) >= 1
 
 
 def test_run_conversion_error_without_software(monkeypatch, tmp_path):
@@ -73,3 +115,386 @@ def test_run_conversion_error_without_software(monkeypatch, tmp_path):
 
     with pytest.raises(RuntimeError):
         run_conversion(settings)
+
+
+def test_run_conversion_parallel_jobs(tmp_path, monkeypatch, fake_ffmpeg):
+    """複数ジョブ指定時に全ファイルが変換され、ログへ記録されることを検証する。"""
+
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for name in ("a.mp4", "b.mp4", "nested/c.mp4"):
+        create_sample_file(input_dir / name)
+    monkeypatch.setattr("video_converter_av1.converter.is_nvenc_available", lambda: True)
+
+    settings = ConverterSettings(input_dir=input_dir, output_dir=output_dir, jobs=2)
+    exit_code = run_conversion(settings)
+
+    assert exit_code == 0
+    assert len(fake_ffmpeg) == 3
+    log_path = output_dir / "convert_log.csv"
+    with log_path.open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert sorted(Path(row["input"]).name for row in rows) == ["a.mp4", "b.mp4", "c.mp4"]
+    assert all(row["status"] == "success" for row in rows)
+
+
+def test_converter_settings_rejects_invalid_jobs(tmp_path):
+    """ジョブ数に 0 以下を指定した場合は検証エラーとなる。"""
+
+    with pytest.raises(ValueError):
+        ConverterSettings(input_dir=tmp_path, output_dir=tmp_path, jobs=0)
+
+
+def test_is_nvenc_available_uses_persistent_cache(tmp_path, monkeypatch):
+    """ffmpeg が更新されていなければ、再判定時にプロセスを起動しないことを検証する。"""
+
+    ffmpeg_path = tmp_path / "bin" / "ffmpeg"
+    create_sample_file(ffmpeg_path)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(converter, "find_ffmpeg", lambda: str(ffmpeg_path))
+    calls: list[list[str]] = []
+
+    def stub(command: list[str], *args, **kwargs) -> SimpleNamespace:
+        calls.append(command)
+        return SimpleNamespace(returncode=0, stdout=" V....D av1_nvenc")
+
+    monkeypatch.setattr("video_converter_av1.converter.subprocess.run", stub)
+    converter.is_nvenc_available.cache_clear()
+    try:
+        assert converter.is_nvenc_available()
+        converter.is_nvenc_available.cache_clear()
+        assert converter.is_nvenc_available()
+    finally:
+        converter.is_nvenc_available.cache_clear()
+
+    assert len(calls) == 1
+    assert (tmp_path / "cache" / "video_converter_av1" / "caps.json").exists()
+
+
+def test_run_conversion_appends_log_with_single_header(tmp_path, monkeypatch, fake_ffmpeg):
+    """再実行時もログのヘッダーは 1 行のみで、結果が追記されることを検証する。"""
+
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    create_sample_file(input_dir / "sample.mp4")
+    monkeypatch.setattr("video_converter_av1.converter.is_nvenc_available", lambda: True)
+
+    settings = ConverterSettings(input_dir=input_dir, output_dir=output_dir)
+    assert run_conversion(settings) == 0
+    Path(fake_ffmpeg[0][-1]).touch()
+    assert run_conversion(settings) == 0
+
+    log_path = output_dir / "convert_log.csv"
+    with log_path.open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.reader(handle))
+    assert rows[0] == ["input", "output", "status", "message"]
+    assert [row[2] for row in rows[1:]] == ["success", "skipped"]
+
+
+def test_collect_target_files_skips_unreadable_directory(tmp_path, monkeypatch):
+    """読み取り権限の無いサブディレクトリを読み飛ばし、他のファイルを収集することを検証する。"""
+
+    create_sample_file(tmp_path / "ok" / "a.mp4")
+    create_sample_file(tmp_path / "locked" / "b.mp4")
+    locked = str(tmp_path / "locked")
+    real_scandir = os.scandir
+
+    def scandir_stub(path):
+        if os.fspath(path) == locked:
+            raise PermissionError(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr("video_converter_av1.converter.os.scandir", scandir_stub)
+
+    assert converter.collect_target_files(tmp_path) == [tmp_path / "ok" / "a.mp4"]
+
+
+def test_run_conversion_with_relative_current_directory(tmp_path, monkeypatch, fake_ffmpeg):
+    """入力ディレクトリに Path(".") を指定しても、相対パスを保った出力先になることを検証する。"""
+
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    create_sample_file(input_dir / "a.mp4")
+    create_sample_file(input_dir / "sub" / "b.mp4")
+    monkeypatch.chdir(input_dir)
+    monkeypatch.setattr("video_converter_av1.converter.is_nvenc_available", lambda: True)
+
+    settings = ConverterSettings(input_dir=Path("."), output_dir=output_dir)
+    assert run_conversion(settings) == 0
+
+    outputs = sorted(command[-1] for command in fake_ffmpeg)
+    assert outputs == [
+        str(output_dir / "1920x1080" / "a.mp4"),
+        str(output_dir / "1920x1080" / "sub" / "b.mp4"),
+    ]
+
+
+def test_run_conversion_skips_existing_with_relative_current_directory(tmp_path, monkeypatch):
+    """Path(".") 入力時も、既存出力の高速判定が対応するファイルだけをスキップすることを検証する。"""
+
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    create_sample_file(input_dir / "a.mp4")
+    create_sample_file(input_dir / "b.mp4")
+    create_sample_file(output_dir / "1280x720" / "a.mp4")
+    monkeypatch.chdir(input_dir)
+    monkeypatch.setattr("video_converter_av1.converter.is_nvenc_available", lambda: True)
+    probes: list[list[str]] = []
+    calls = install_fake_tools(monkeypatch, probes=probes)
+
+    settings = ConverterSettings(input_dir=Path("."), output_dir=output_dir)
+    assert run_conversion(settings) == 0
+
+    assert [probe[-1] for probe in probes] == ["b.mp4"]
+    assert [command[-1] for command in calls] == [str(output_dir / "1920x1080" / "b.mp4")]
+    with (output_dir / "convert_log.csv").open(newline="", encoding="utf-8") as handle:
+        statuses = {row["input"]: row["status"] for row in csv.DictReader(handle)}
+    assert statuses == {"a.mp4": "skipped", "b.mp4": "success"}
+
+
+def test_generate_unique_path_uses_next_index(tmp_path):
+    """既存の連番の最大値に 1 を加えたパスが生成されることを検証する。"""
+
+    for name in ("sample.mp4", "sample_1.mp4", "sample_3.mp4", "other_9.mp4"):
+        (tmp_path / name).touch()
+
+    assert converter.generate_unique_path(tmp_path / "sample.mp4") == tmp_path / "sample_4.mp4"
+
+
+def test_disk_space_budget_reprobes_only_when_low(tmp_path, monkeypatch):
+    """見積もり残量が十分な間は空き容量を再取得せず、不足時は例外となることを検証する。"""
+
+    probes: list[Path] = []
+
+    def fake_disk_usage(path: Path) -> SimpleNamespace:
+        probes.append(path)
+        return SimpleNamespace(free=1000)
+
+    monkeypatch.setattr("video_converter_av1.converter.shutil.disk_usage", fake_disk_usage)
+    budget = converter.DiskSpaceBudget(tmp_path)
+    budget.reserve(100)
+    budget.reserve(100)
+    assert len(probes) == 1
+
+    with pytest.raises(RuntimeError):
+        budget.reserve(2000)
+    assert len(probes) == 2
+
+
+def test_disk_space_budget_accounts_for_in_flight_encodes(tmp_path, monkeypatch):
+    """再取得した空き容量から、実行中のエンコードが確保した見積もりを差し引くことを検証する。"""
+
+    monkeypatch.setattr(
+        "video_converter_av1.converter.shutil.disk_usage",
+        lambda path: SimpleNamespace(free=1000),
+    )
+    budget = converter.DiskSpaceBudget(tmp_path)
+    reserved = budget.reserve(500)
+
+    with pytest.raises(RuntimeError):
+        budget.reserve(300)
+
+    budget.release(reserved)
+    budget.reserve(300)
+
+
+def test_run_conversion_limits_concurrent_encodes(tmp_path, monkeypatch):
+    """準備用スレッドがあっても、ffmpeg の同時実行数が jobs を超えないことを検証する。"""
+
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for name in ("a.mp4", "b.mp4", "c.mp4"):
+        create_sample_file(input_dir / name)
+    monkeypatch.setattr("video_converter_av1.converter.is_nvenc_available", lambda: True)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def on_encode(command: list[str]) -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    install_fake_tools(monkeypatch, on_encode=on_encode)
+    settings = ConverterSettings(input_dir=input_dir, output_dir=output_dir, jobs=1)
+
+    assert run_conversion(settings) == 0
+    assert peak == 1
+
+
+def test_run_conversion_stops_on_interrupt(tmp_path, monkeypatch):
+    """変換中に中断された場合、未着手のファイルを変換・削除せずに終了することを検証する。"""
+
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    names = [f"{index}.mp4" for index in range(10)]
+    for name in names:
+        create_sample_file(input_dir / name)
+    monkeypatch.setattr("video_converter_av1.converter.is_nvenc_available", lambda: True)
+    calls = install_fake_tools(monkeypatch, on_encode=lambda command: time.sleep(0.1))
+
+    def interrupt(*args, **kwargs) -> None:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr("video_converter_av1.converter.write_log_entry", interrupt)
+    settings = ConverterSettings(
+        input_dir=input_dir, output_dir=output_dir, jobs=1, delete_original=True
+    )
+
+    started = time.monotonic()
+    with pytest.raises(KeyboardInterrupt):
+        run_conversion(settings)
+
+    assert time.monotonic() - started < 0.5
+    # 中断時点で実行枠を得ていた jobs + 1 件以内に限られ、残りは ffmpeg を起動しない。
+    assert len(calls) <= 2
+    remaining = [name for name in names if (input_dir / name).exists()]
+    assert len(remaining) >= len(names) - 2
+
+
+def test_run_conversion_skips_existing_without_probe(tmp_path, monkeypatch):
+    """変換済みの出力がある場合、ffprobe を起動せずにスキップすることを検証する。"""
+
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    create_sample_file(input_dir / "nested" / "sample.mp4")
+    create_sample_file(output_dir / "1280x720" / "nested" / "sample.mp4")
+    monkeypatch.setattr("video_converter_av1.converter.is_nvenc_available", lambda: True)
+    probes: list[list[str]] = []
+    calls = install_fake_tools(monkeypatch, probes=probes)
+    settings = ConverterSettings(input_dir=input_dir, output_dir=output_dir)
+
+    assert run_conversion(settings) == 0
+    assert probes == []
+    assert calls == []
+    with (output_dir / "convert_log.csv").open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert rows[0]["status"] == "skipped"
+
+
+def test_write_log_entry_matches_csv_module(tmp_path):
+    """直接書き込みと csv モジュール経由の行が、同じ CSV として読み戻せることを検証する。"""
+
+    log_path = tmp_path / "convert_log.csv"
+    entries = [
+        converter.ConversionLogEntry(
+            input_path=tmp_path / "plain.mp4",
+            output_path=tmp_path / "out" / "plain.mp4",
+            status=converter.ConversionStatus.SUCCESS,
+        ),
+        converter.ConversionLogEntry(
+            input_path=tmp_path / 'quote"d, name.mp4',
+            output_path=None,
+            status=converter.ConversionStatus.FAILED,
+            message="line1\nline2",
+        ),
+    ]
+    for entry in entries:
+        converter.append_log_entry(log_path, entry)
+
+    with log_path.open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.reader(handle))
+    assert rows == [
+        ["input", "output", "status", "message"],
+        [str(tmp_path / "plain.mp4"), str(tmp_path / "out" / "plain.mp4"), "success", ""],
+        [str(tmp_path / 'quote"d, name.mp4'), "", "failed", "line1\nline2"],
+    ]
+    assert log_path.read_bytes().count(b"\r\n") == 3
+
+
+def test_run_conversion_skips_av1_input(tmp_path, monkeypatch):
+    """入力が既に AV1 の場合は ffmpeg を起動せずにスキップとして記録することを検証する。"""
+
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    create_sample_file(input_dir / "sample.mp4")
+    monkeypatch.setattr("video_converter_av1.converter.is_nvenc_available", lambda: True)
+    calls = install_fake_tools(monkeypatch, probe_stdout="av1,1920,1080")
+    settings = ConverterSettings(input_dir=input_dir, output_dir=output_dir, delete_original=True)
+
+    assert run_conversion(settings) == 0
+    assert calls == []
+    assert (input_dir / "sample.mp4").exists()
+    with (output_dir / "convert_log.csv").open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert rows[0]["status"] == "skipped"
+
+
+def test_parse_arguments_reuses_parser(tmp_path):
+    """パーサーを使い回しても、呼び出しごとに独立した設定が得られることを検証する。"""
+
+    first = converter.parse_arguments([str(tmp_path), str(tmp_path), "--jobs", "3"])
+    second = converter.parse_arguments([str(tmp_path), str(tmp_path), "--no-skip-av1"])
+
+    assert first.jobs == 3
+    assert first.skip_av1 is True
+    assert second.jobs is None
+    assert second.skip_av1 is False
+    assert converter._get_parser() is converter._get_parser()
+
+
+def test_batch_file_sizes_disabled_without_env(tmp_path, monkeypatch):
+    """環境変数が未指定の場合は io_uring を使わず、空の結果を返すことを検証する。"""
+
+    sample = tmp_path / "sample.mp4"
+    create_sample_file(sample)
+    monkeypatch.delenv(uring.USE_IO_URING_ENV, raising=False)
+
+    assert uring.batch_file_sizes([sample]) == {}
+
+
+def test_batch_file_sizes_with_io_uring(tmp_path, monkeypatch):
+    """io_uring 有効時に取得したサイズが stat の結果と一致し、欠損ファイルを除外することを検証する。"""
+
+    pytest.importorskip("liburing")
+    sample = tmp_path / "sample.mp4"
+    create_sample_file(sample)
+    missing = tmp_path / "missing.mp4"
+    monkeypatch.setenv(uring.USE_IO_URING_ENV, "1")
+
+    if not uring.batch_file_sizes([sample]):
+        pytest.skip("この環境では io_uring を利用できません")
+
+    sizes = uring.batch_file_sizes([sample, missing])
+
+    assert sizes == {sample: sample.stat().st_size}
+
+
+def test_run_conversion_records_ffmpeg_stderr_on_failure(tmp_path, monkeypatch):
+    """ffmpeg が異常終了した場合、標準エラー出力の末尾をログに残し原本を保持することを検証する。"""
+
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    create_sample_file(input_dir / "sample.mp4")
+    monkeypatch.setattr("video_converter_av1.converter.is_nvenc_available", lambda: True)
+    install_fake_tools(
+        monkeypatch,
+        on_encode=lambda command: FakePopen(returncode=1, stderr=b"Error: encoder busy\n"),
+    )
+    settings = ConverterSettings(input_dir=input_dir, output_dir=output_dir, delete_original=True)
+
+    assert run_conversion(settings) == 1
+    assert (input_dir / "sample.mp4").exists()
+    with (output_dir / "convert_log.csv").open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert rows[0]["status"] == "failed"
+    assert "Error: encoder busy" in rows[0]["message"]
+
+
+def test_run_ffmpeg_detaches_stdin(monkeypatch):
+    """並列実行する ffmpeg が端末の標準入力を共有しないことを検証する。"""
+
+    received: dict[str, object] = {}
+
+    def popen_stub(command: list[str], **kwargs) -> FakePopen:
+        received.update(kwargs)
+        return FakePopen()
+
+    monkeypatch.setattr("video_converter_av1.converter.subprocess.Popen", popen_stub)
+    converter.run_ffmpeg(["ffmpeg", "-version"])
+
+    assert received["stdin"] is subprocess.DEVNULL